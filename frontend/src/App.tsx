@@ -626,11 +626,16 @@ function FileDiff({ file }: FileDiffProps) {
         {file.hunks.map((hunk, i) => {
           let k_new = 0
           let k_old = 0
+          const lines = hunk.content === '' ? [] : hunk.content.split('\n')
+          const header =
+            `@@ -${hunk.old_start},${hunk.old_count}` +
+            ` +${hunk.new_start},${hunk.new_count} @@` +
+            (hunk.context ? ` ${hunk.context}` : '')
           return (
             <Box key={i}>
-              <Code size="1">{hunk.header}</Code>
+              <Code size="1">{header}</Code>
               <Flex direction="column" className="diff-container">
-                {hunk.content.map((line, j) => {
+                {lines.map((line, j) => {
                   const isDel = line.startsWith('-')
                   const isAdd = line.startsWith('+')
 
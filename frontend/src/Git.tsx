@@ -36,12 +36,15 @@ export type GitTag = {
 }
 
 export type GitDiffHunk = {
-  header: string
+  // function context from the hunk header; the "@@ -a,b +c,d @@" prefix is
+  // rebuilt from the counts below
+  context: string
   old_start: number
   old_count: number
   new_start: number
   new_count: number
-  content: string[]
+  // newline-joined hunk body; split on '\n' for rendering
+  content: string
   added_lines: number
   removed_lines: number
 }
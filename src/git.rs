@@ -2,7 +2,7 @@ use serde::{Deserialize, Serialize};
 use std::path::{Path, PathBuf};
 use tokio::process::Command;
 
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Copy, Serialize, Deserialize, PartialEq)]
 #[serde(rename_all = "lowercase")]
 pub enum GitFileChangeType {
     Added,
@@ -12,7 +12,7 @@ pub enum GitFileChangeType {
     Copied,
 }
 
-#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
+#[derive(Debug, Clone, Copy, Serialize, Deserialize, PartialEq)]
 #[serde(rename_all = "lowercase")]
 pub enum GitDiffAlgorithm {
     Myers,
@@ -38,7 +38,7 @@ impl std::fmt::Display for GitDiffAlgorithm {
     }
 }
 
-#[derive(Debug, Clone, Serialize, Deserialize)]
+#[derive(Debug, Clone, Copy, Serialize, Deserialize)]
 pub struct GitFlags {
     pub max_count: u32,
     pub context_lines: u32,
@@ -62,7 +62,9 @@ pub struct GitBranch {
     pub name: String,
     pub is_current: bool,
     pub is_remote: bool,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub remote: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub points_to: Option<String>,
 }
 
@@ -78,17 +80,23 @@ pub struct Commit {
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct GitTag {
     pub name: String,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub message: Option<String>,
 }
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct DiffHunk {
-    pub header: String,
+    /// Function context from the hunk header (the text after the closing
+    /// "@@"), if any. The "@@ -a,b +c,d @@" prefix itself is redundant with
+    /// the four counts below and is reconstructed by the frontend.
+    pub context: String,
     pub old_start: u32,
     pub old_count: u32,
     pub new_start: u32,
     pub new_count: u32,
-    pub content: Vec<String>,
+    /// Hunk body as one newline-joined buffer; the frontend splits it for
+    /// rendering. One allocation per hunk instead of one per line.
+    pub content: String,
     pub added_lines: u32,
     pub removed_lines: u32,
 }
@@ -96,13 +104,15 @@ pub struct DiffHunk {
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct DiffFile {
     pub file_path: String,
-    pub change_type: String,
+    pub change_type: GitFileChangeType,
     pub hunks: Vec<DiffHunk>,
 }
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct GitDiff {
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub from_commit: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub to_commit: Option<String>,
     pub files: Vec<DiffFile>,
 }
@@ -111,16 +121,22 @@ pub struct GitDiff {
 pub struct FileChange {
     pub path: String,
     pub change_type: GitFileChangeType,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub old_path: Option<String>,
     pub is_binary: bool,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub additions: Option<u32>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub deletions: Option<u32>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub changes: Option<u32>,
 }
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct GitDiffSummary {
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub commit_a: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub commit_b: Option<String>,
     pub files: Vec<FileChange>,
     pub total_files_changed: u32,
@@ -134,13 +150,14 @@ pub fn find_git_repos(root: &Path) -> Vec<RepoEntry> {
     group_repos_by_worktree(&paths)
 }
 
-#[derive(Debug, Clone, Serialize, Deserialize)]
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
 pub struct Worktree {
     pub path: String,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub branch: Option<String>,
 }
 
-#[derive(Debug, Clone, Serialize, Deserialize)]
+#[derive(Debug, Clone, Serialize, Deserialize, PartialEq)]
 pub struct RepoEntry {
     pub path: String,
     pub worktrees: Vec<Worktree>,
@@ -148,10 +165,9 @@ pub struct RepoEntry {
 
 fn get_worktrees(repo_path: &str) -> Vec<Worktree> {
     let output = std::process::Command::new("git")
-        .arg("worktree")
-        .arg("list")
-        .arg("--porcelain")
+        .args(["worktree", "list", "--porcelain"])
         .current_dir(repo_path)
+        .stdin(std::process::Stdio::null())
         .output();
 
     let output = match output {
@@ -188,19 +204,50 @@ fn get_worktrees(repo_path: &str) -> Vec<Worktree> {
     worktrees
 }
 
+/// Run `git worktree list` for every repo on a bounded pool of worker
+/// threads. Discovery runs on a blocking thread, and with many repos the
+/// serial spawn-per-repo used to dominate its runtime; the bound keeps us
+/// from launching hundreds of git processes at once.
+fn get_all_worktrees(paths: &[String]) -> Vec<Vec<Worktree>> {
+    use std::sync::Mutex;
+    use std::sync::atomic::{AtomicUsize, Ordering};
+
+    const MAX_WORKERS: usize = 8;
+
+    let next = AtomicUsize::new(0);
+    let slots: Vec<Mutex<Vec<Worktree>>> = paths.iter().map(|_| Mutex::new(Vec::new())).collect();
+
+    std::thread::scope(|s| {
+        for _ in 0..MAX_WORKERS.min(paths.len()) {
+            s.spawn(|| {
+                loop {
+                    let i = next.fetch_add(1, Ordering::Relaxed);
+                    if i >= paths.len() {
+                        break;
+                    }
+                    *slots[i].lock().unwrap() = get_worktrees(&paths[i]);
+                }
+            });
+        }
+    });
+
+    slots.into_iter().map(|m| m.into_inner().unwrap()).collect()
+}
+
 fn group_repos_by_worktree(paths: &[String]) -> Vec<RepoEntry> {
     use std::collections::HashSet;
 
     let path_set: HashSet<&str> = paths.iter().map(|s| s.as_str()).collect();
     let mut claimed: HashSet<&str> = HashSet::new();
     let mut entries: Vec<RepoEntry> = Vec::new();
+    let mut all_worktrees = get_all_worktrees(paths);
 
-    for path in paths {
+    for (i, path) in paths.iter().enumerate() {
         if claimed.contains(path.as_str()) {
             continue;
         }
 
-        let worktrees = get_worktrees(path);
+        let worktrees = std::mem::take(&mut all_worktrees[i]);
 
         // The first entry from `git worktree list` is always the main worktree
         let main_path = worktrees
@@ -250,10 +297,19 @@ fn find_git_repos_recursive(dir: &Path, repos: &mut Vec<String>) {
             has_git = true;
             break;
         }
-        let path = entry.path();
-        if path.is_dir() {
-            subdirs.push(path);
+        // file_type() comes from the directory entry itself (no extra stat
+        // on most filesystems) and never follows symlinks, so symlinked
+        // trees are not walked — which could previously even cycle.
+        if !entry.file_type().is_ok_and(|t| t.is_dir()) {
+            continue;
+        }
+        // Hidden directories and node_modules can be enormous and don't
+        // contain repos we want to surface.
+        let name = name.to_string_lossy();
+        if name.starts_with('.') || name == "node_modules" {
+            continue;
         }
+        subdirs.push(entry.path());
     }
 
     if has_git {
@@ -265,114 +321,143 @@ fn find_git_repos_recursive(dir: &Path, repos: &mut Vec<String>) {
     }
 }
 
+/// Parse `git for-each-ref` output in the format produced by
+/// `get_list_of_branches`: `%(HEAD)%01%(refname)%01%(symref:short)`.
 pub fn parse_git_branches(output: &str) -> Vec<GitBranch> {
     let mut branches = Vec::new();
 
     for line in output.lines() {
-        let line = line.trim();
-        if line.is_empty() {
+        let mut fields = line.splitn(3, '\x01');
+        let (Some(head), Some(refname), Some(symref)) =
+            (fields.next(), fields.next(), fields.next())
+        else {
             continue;
-        }
+        };
 
-        let is_current = line.starts_with("* ");
-        let line = line.strip_prefix("* ").unwrap_or(line);
-        let line = line.strip_prefix("+ ").unwrap_or(line);
-
-        if line.contains("->") {
-            let parts: Vec<&str> = line.splitn(2, "->").collect();
-            let name_part = parts[0].trim();
-            let target = parts[1].trim();
-            let is_remote = name_part.starts_with("remotes/");
-            let remote = if is_remote {
-                name_part.split('/').nth(1).map(|s| s.to_string())
-            } else {
-                None
-            };
-            let name = name_part
-                .strip_prefix("remotes/")
-                .unwrap_or(name_part)
-                .to_string();
-            branches.push(GitBranch {
-                name,
-                is_current,
-                is_remote,
-                remote,
-                points_to: Some(target.to_string()),
-            });
+        let (name, is_remote, remote) = if let Some(rest) = refname.strip_prefix("refs/remotes/") {
+            let remote = rest.split('/').next().map(|s| s.to_string());
+            (rest.to_string(), true, remote)
+        } else if let Some(rest) = refname.strip_prefix("refs/heads/") {
+            (rest.to_string(), false, None)
         } else {
-            let is_remote = line.starts_with("remotes/");
-            let remote = if is_remote {
-                line.split('/').nth(1).map(|s| s.to_string())
-            } else {
-                None
-            };
-            let name = line.strip_prefix("remotes/").unwrap_or(line).to_string();
-            branches.push(GitBranch {
-                name,
-                is_current,
-                is_remote,
-                remote,
-                points_to: None,
-            });
-        }
+            continue;
+        };
+
+        let points_to = if symref.is_empty() {
+            None
+        } else {
+            Some(symref.to_string())
+        };
+
+        branches.push(GitBranch {
+            name,
+            is_current: head == "*",
+            is_remote,
+            remote,
+            points_to,
+        });
     }
 
     branches
 }
 
+/// Parse `git for-each-ref` output in the format produced by
+/// `get_list_of_tags`: `%(refname:short)%01%(contents:subject)`.
 pub fn parse_git_tags(output: &str) -> Vec<GitTag> {
     let mut tags = Vec::new();
 
     for line in output.lines() {
-        let line = line.trim();
-        if line.is_empty() {
+        let Some((name, message)) = line.split_once('\x01') else {
+            continue;
+        };
+        if name.is_empty() {
             continue;
         }
 
-        let mut parts = line.splitn(2, char::is_whitespace);
-        let name = parts.next().unwrap_or("").to_string();
-        let message = parts.next().map(|s| s.to_string());
-
-        tags.push(GitTag { name, message });
+        tags.push(GitTag {
+            name: name.to_string(),
+            message: if message.is_empty() {
+                None
+            } else {
+                Some(message.to_string())
+            },
+        });
     }
 
     tags
 }
 
-pub async fn git_fetch(repo: &str) -> Result<(), String> {
-    let output = Command::new("git")
-        .args(["fetch", "--all"])
-        .current_dir(repo)
+/// Base `git` command for `repo`. We cannot keep one long-lived git process
+/// around for diffs (there is no batch mode for `diff`/`show`), so the next
+/// best thing is making each spawn as cheap as possible and setting
+/// `GIT_OPTIONAL_LOCKS=0` so read-only queries never take the index lock —
+/// otherwise concurrent invocations against the same repo serialize on it.
+fn git_command(repo: &str) -> Command {
+    let mut cmd = Command::new("git");
+    cmd.current_dir(repo)
+        .env("GIT_OPTIONAL_LOCKS", "0")
+        // None of these commands read stdin; don't let them inherit ours,
+        // which also stops git from ever prompting interactively.
+        .stdin(std::process::Stdio::null());
+    cmd
+}
+
+/// Reuse a child's stdout buffer as a String without copying. Git output is
+/// effectively always valid UTF-8, in which case this is free; invalid bytes
+/// fall back to a lossy copy.
+fn stdout_into_string(stdout: Vec<u8>) -> String {
+    String::from_utf8(stdout).unwrap_or_else(|e| String::from_utf8_lossy(e.as_bytes()).into_owned())
+}
+
+/// Run a one-shot git command and return its stdout.
+async fn run_git(repo: &str, args: &[&str]) -> Result<String, String> {
+    let output = git_command(repo)
+        .args(args)
         .output()
         .await
-        .map_err(|e| format!("Failed to run git fetch: {e}"))?;
+        .map_err(|e| format!("Failed to run git {}: {e}", args[0]))?;
 
     if !output.status.success() {
         return Err(format!(
-            "Git fetch failed: {}",
+            "Git {} failed: {}",
+            args[0],
             String::from_utf8_lossy(&output.stderr)
         ));
     }
 
-    Ok(())
+    Ok(stdout_into_string(output.stdout))
 }
 
-pub async fn get_list_of_branches(repo: &str) -> Result<Vec<GitBranch>, String> {
-    let output = Command::new("git")
-        .args(["branch", "--list", "--all", "--no-color"])
-        .current_dir(repo)
-        .output()
-        .await
-        .map_err(|e| format!("Failed to run git branch: {e}"))?;
+pub async fn git_fetch(repo: &str) -> Result<(), String> {
+    run_git(repo, &["fetch", "--all"]).await.map(|_| ())
+}
 
-    if !output.status.success() {
-        return Err(format!(
-            "Git branch failed: {}",
-            String::from_utf8_lossy(&output.stderr)
-        ));
+/// Name of the branch HEAD points to, or None when detached (or on error).
+pub async fn get_head_branch(repo: &str) -> Option<String> {
+    let stdout = run_git(repo, &["rev-parse", "--abbrev-ref", "HEAD"])
+        .await
+        .ok()?;
+    let name = stdout.trim();
+    if name.is_empty() || name == "HEAD" {
+        None
+    } else {
+        Some(name.to_string())
     }
+}
 
-    let stdout = String::from_utf8_lossy(&output.stdout);
+pub async fn get_list_of_branches(repo: &str) -> Result<Vec<GitBranch>, String> {
+    // for-each-ref with an explicit format is machine-readable, unlike the
+    // human-oriented `git branch` listing we used to scrape.
+    let stdout = run_git(
+        repo,
+        &[
+            "for-each-ref",
+            "refs/heads",
+            "refs/remotes",
+            "--format=%(HEAD)%01%(refname)%01%(symref:short)",
+        ],
+    )
+    .await?;
     Ok(parse_git_branches(&stdout))
 }
 
@@ -385,21 +470,17 @@ pub async fn get_current_branch(repo: &str) -> Result<GitBranch, String> {
 }
 
 pub async fn get_list_of_tags(repo: &str) -> Result<Vec<GitTag>, String> {
-    let output = Command::new("git")
-        .args(["tag", "--list", "--no-color"])
-        .current_dir(repo)
-        .output()
-        .await
-        .map_err(|e| format!("Failed to run git tag: {e}"))?;
-
-    if !output.status.success() {
-        return Err(format!(
-            "Git tag failed: {}",
-            String::from_utf8_lossy(&output.stderr)
-        ));
-    }
-
-    let stdout = String::from_utf8_lossy(&output.stdout);
+    // `git tag --list` only ever printed names, so tag messages were always
+    // empty; for-each-ref gives us the subject line in the same call.
+    let stdout = run_git(
+        repo,
+        &[
+            "for-each-ref",
+            "refs/tags",
+            "--format=%(refname:short)%01%(contents:subject)",
+        ],
+    )
+    .await?;
     Ok(parse_git_tags(&stdout))
 }
 
@@ -408,19 +489,20 @@ pub async fn get_git_log(
     branch: Option<&str>,
     max_count: u32,
 ) -> Result<Vec<Commit>, String> {
-    const SEP1: &str = "<<<><<>>>";
-    const SEP2: &str = "><><><<>>";
-
-    let format_str = format!("{SEP1}%h{SEP2}%an{SEP2}%ad{SEP2}%s{SEP2}%b");
-
-    let mut cmd = Command::new("git");
+    // NUL-separated records with 0x01 field separators: control characters
+    // cannot collide with commit message content, unlike printable sentinel
+    // strings, and splitting on a single char is cheaper than a multi-byte
+    // needle.
+    const RECORD_SEP: char = '\0';
+    const FIELD_SEP: char = '\x01';
+
+    let mut cmd = git_command(repo);
     cmd.args([
         "log",
         &format!("--max-count={max_count}"),
-        &format!("--pretty=format:{format_str}"),
+        "--pretty=format:%x00%h%x01%an%x01%ad%x01%s%x01%b",
         "--date=iso",
-    ])
-    .current_dir(repo);
+    ]);
 
     if let Some(branch) = branch {
         cmd.arg(branch);
@@ -441,157 +523,304 @@ pub async fn get_git_log(
     let stdout = String::from_utf8_lossy(&output.stdout);
     let mut commits = Vec::new();
 
-    for record in stdout.split(SEP1) {
+    for record in stdout.split(RECORD_SEP) {
         if record.trim().is_empty() {
             continue;
         }
-        let parts: Vec<&str> = record.splitn(5, SEP2).collect();
-        if parts.len() < 5 {
+        let mut fields = record.splitn(5, FIELD_SEP);
+        let (Some(short_hash), Some(author), Some(date), Some(summary), Some(body)) = (
+            fields.next(),
+            fields.next(),
+            fields.next(),
+            fields.next(),
+            fields.next(),
+        ) else {
             continue;
-        }
+        };
         commits.push(Commit {
-            short_hash: parts[0].trim().to_string(),
-            author: parts[1].trim().to_string(),
-            date: parts[2].trim().to_string(),
-            summary: parts[3].trim().to_string(),
-            body: parts[4].trim().to_string(),
+            short_hash: short_hash.trim().to_string(),
+            author: author.trim().to_string(),
+            date: date.trim().to_string(),
+            summary: summary.trim().to_string(),
+            body: body.trim().to_string(),
         });
     }
 
     Ok(commits)
 }
 
-fn parse_hunk_header(header: &str) -> Option<(u32, u32, u32, u32)> {
-    let re_pattern = header.strip_prefix("@@ -")?;
-    let at_pos = re_pattern.find(" @@")?;
-    let ranges = &re_pattern[..at_pos];
-
-    let parts: Vec<&str> = ranges.splitn(2, " +").collect();
-    if parts.len() != 2 {
-        return None;
+fn parse_hunk_header(header: &str) -> Option<(u32, u32, u32, u32, &str)> {
+    // A range is "start" or "start,count"; a missing count means 1.
+    fn parse_range(range: &str) -> Option<(u32, u32)> {
+        match range.split_once(',') {
+            Some((start, count)) => Some((start.parse().ok()?, count.parse().unwrap_or(1))),
+            None => Some((range.parse().ok()?, 1)),
+        }
     }
 
-    let old_parts: Vec<&str> = parts[0].splitn(2, ',').collect();
-    let new_parts: Vec<&str> = parts[1].splitn(2, ',').collect();
+    let rest = header.strip_prefix("@@ -")?;
+    let at = rest.find(" @@")?;
+    let (old, new) = rest[..at].split_once(" +")?;
+    let context = rest[at + 3..].trim_start();
 
-    let old_start = old_parts[0].parse::<u32>().ok()?;
-    let old_count = old_parts.get(1).and_then(|s| s.parse().ok()).unwrap_or(1);
-    let new_start = new_parts[0].parse::<u32>().ok()?;
-    let new_count = new_parts.get(1).and_then(|s| s.parse().ok()).unwrap_or(1);
+    let (old_start, old_count) = parse_range(old)?;
+    let (new_start, new_count) = parse_range(new)?;
 
-    Some((old_start, old_count, new_start, new_count))
+    Some((old_start, old_count, new_start, new_count, context))
 }
 
-fn parse_diff_output(stdout: &str) -> Vec<DiffFile> {
-    let mut files: Vec<DiffFile> = Vec::new();
-    let mut current_file: Option<DiffFile> = None;
-    let mut current_hunk: Option<DiffHunk> = None;
+// The separator is keyed on an explicit flag rather than content.is_empty():
+// with diff.suppressBlankEmpty git emits blank context lines as truly empty,
+// and an empty first line would otherwise leave the buffer "empty" and be
+// silently merged into the next line.
+fn push_content(content: &mut String, has_lines: &mut bool, line: &str) {
+    if *has_lines {
+        content.push('\n');
+    }
+    content.push_str(line);
+    *has_lines = true;
+}
 
-    for line in stdout.lines() {
-        if line.starts_with("diff --git") {
-            if let Some(hunk) = current_hunk.take() {
-                if let Some(ref mut file) = current_file {
-                    file.hunks.push(hunk);
+/// Incremental parser for `git diff`/`git show --patch` output, fed one line
+/// at a time so callers can stream git's stdout instead of buffering it.
+#[derive(Default)]
+struct DiffParser {
+    files: Vec<DiffFile>,
+    current_file: Option<DiffFile>,
+    current_hunk: Option<DiffHunk>,
+    hunk_has_lines: bool,
+}
+
+impl DiffParser {
+    // Classify each line by its first byte so the hot path (hunk content,
+    // the vast majority of lines in a large diff) does a single byte compare
+    // instead of walking a chain of `starts_with` checks. The rare header
+    // lines ("diff --git", file modes, "---"/"+++", "@@") are only string
+    // matched once the first byte has already narrowed them down.
+    #[inline]
+    fn push_line(&mut self, line: &str) {
+        match line.as_bytes().first() {
+            Some(b'+') => {
+                // "+++" file headers only appear before the first hunk of a
+                // file; once a hunk is open, a line starting with '+' is an
+                // added line (possibly one whose own text begins with "++"),
+                // so no further prefix checks are needed.
+                if let Some(ref mut hunk) = self.current_hunk {
+                    push_content(&mut hunk.content, &mut self.hunk_has_lines, line);
+                    hunk.added_lines += 1;
+                } else if line.starts_with("+++ ")
+                    && self
+                        .current_file
+                        .as_ref()
+                        .is_some_and(|f| f.file_path.is_empty())
+                {
+                    if let Some(path) = line.strip_prefix("+++ b/") {
+                        if let Some(ref mut file) = self.current_file {
+                            file.file_path = path.to_string();
+                        }
+                    }
                 }
             }
-            if let Some(file) = current_file.take() {
-                files.push(file);
+            Some(b'-') => {
+                if let Some(ref mut hunk) = self.current_hunk {
+                    push_content(&mut hunk.content, &mut self.hunk_has_lines, line);
+                    hunk.removed_lines += 1;
+                } else if line.starts_with("--- ")
+                    && self
+                        .current_file
+                        .as_ref()
+                        .is_some_and(|f| f.file_path.is_empty())
+                {
+                    if let Some(path) = line.strip_prefix("--- a/") {
+                        if let Some(ref mut file) = self.current_file {
+                            file.file_path = path.to_string();
+                        }
+                    }
+                }
             }
-            current_file = Some(DiffFile {
-                file_path: String::new(),
-                change_type: "modified".to_string(),
-                hunks: Vec::new(),
-            });
-        } else if line.starts_with("new file mode") {
-            if let Some(ref mut file) = current_file {
-                file.change_type = "added".to_string();
+            Some(b' ') => {
+                if let Some(ref mut hunk) = self.current_hunk {
+                    push_content(&mut hunk.content, &mut self.hunk_has_lines, line);
+                }
             }
-        } else if line.starts_with("deleted file mode") {
-            if let Some(ref mut file) = current_file {
-                file.change_type = "deleted".to_string();
+            Some(b'@') if line.starts_with("@@") => {
+                if let Some(hunk) = self.current_hunk.take() {
+                    if let Some(ref mut file) = self.current_file {
+                        file.hunks.push(hunk);
+                    }
+                }
+                // No trimming needed: lines() already strips the newline and
+                // git emits hunk headers without surrounding whitespace.
+                if let Some((old_start, old_count, new_start, new_count, context)) =
+                    parse_hunk_header(line)
+                {
+                    // The header bounds how many lines follow (old_count +
+                    // new_count); reserve a rough byte estimate up front so
+                    // the buffer doesn't regrow repeatedly while the hunk
+                    // streams in.
+                    let capacity = (old_count + new_count) as usize * 32;
+                    self.hunk_has_lines = false;
+                    self.current_hunk = Some(DiffHunk {
+                        context: context.to_string(),
+                        old_start,
+                        old_count,
+                        new_start,
+                        new_count,
+                        content: String::with_capacity(capacity),
+                        added_lines: 0,
+                        removed_lines: 0,
+                    });
+                }
             }
-        } else if (line.starts_with("--- ") || line.starts_with("+++ "))
-            && current_file
-                .as_ref()
-                .is_some_and(|f| f.file_path.is_empty())
-        {
-            if let Some(ref mut file) = current_file {
-                if let Some(path) = line.strip_prefix("+++ b/") {
-                    file.file_path = path.to_string();
-                } else if let Some(path) = line.strip_prefix("--- a/") {
-                    file.file_path = path.to_string();
+            Some(b'd') if line.starts_with("diff --git") => {
+                if let Some(hunk) = self.current_hunk.take() {
+                    if let Some(ref mut file) = self.current_file {
+                        file.hunks.push(hunk);
+                    }
+                }
+                if let Some(file) = self.current_file.take() {
+                    self.files.push(file);
                 }
+                self.current_file = Some(DiffFile {
+                    file_path: String::new(),
+                    change_type: GitFileChangeType::Modified,
+                    hunks: Vec::new(),
+                });
             }
-        } else if line.starts_with("@@") {
-            if let Some(hunk) = current_hunk.take() {
-                if let Some(ref mut file) = current_file {
-                    file.hunks.push(hunk);
+            Some(b'n') if line.starts_with("new file mode") => {
+                if let Some(ref mut file) = self.current_file {
+                    file.change_type = GitFileChangeType::Added;
                 }
             }
-            if let Some((old_start, old_count, new_start, new_count)) =
-                parse_hunk_header(line.trim())
-            {
-                current_hunk = Some(DiffHunk {
-                    header: line.trim().to_string(),
-                    old_start,
-                    old_count,
-                    new_start,
-                    new_count,
-                    content: Vec::new(),
-                    added_lines: 0,
-                    removed_lines: 0,
-                });
+            Some(b'd') if line.starts_with("deleted file mode") => {
+                if let Some(ref mut file) = self.current_file {
+                    file.change_type = GitFileChangeType::Deleted;
+                }
             }
-        } else if let Some(ref mut hunk) = current_hunk {
-            hunk.content.push(line.to_string());
-            if line.starts_with('+') && !line.starts_with("+++") {
-                hunk.added_lines += 1;
-            } else if line.starts_with('-') && !line.starts_with("---") {
-                hunk.removed_lines += 1;
+            _ => {
+                if let Some(ref mut hunk) = self.current_hunk {
+                    push_content(&mut hunk.content, &mut self.hunk_has_lines, line);
+                }
             }
         }
     }
 
-    if let Some(hunk) = current_hunk.take() {
-        if let Some(ref mut file) = current_file {
-            file.hunks.push(hunk);
+    fn finish(mut self) -> Vec<DiffFile> {
+        if let Some(hunk) = self.current_hunk.take() {
+            if let Some(ref mut file) = self.current_file {
+                file.hunks.push(hunk);
+            }
+        }
+        if let Some(file) = self.current_file.take() {
+            self.files.push(file);
         }
+        self.files
     }
-    if let Some(file) = current_file.take() {
-        files.push(file);
+}
+
+/// Spawn a diff-producing git command and stream its stdout through
+/// `DiffParser` line by line, so large patches are never held in memory
+/// twice (full buffer plus parsed lines).
+async fn run_diff_command(mut cmd: Command) -> Result<Vec<DiffFile>, String> {
+    use std::process::Stdio;
+    use tokio::io::{AsyncBufReadExt, BufReader};
+
+    use tokio::io::AsyncReadExt;
+
+    cmd.stdout(Stdio::piped()).stderr(Stdio::piped());
+    let mut child = cmd.spawn().map_err(|e| format!("Failed to run git: {e}"))?;
+
+    let stdout = child.stdout.take().expect("stdout is piped");
+    let mut stderr = child.stderr.take().expect("stderr is piped");
+
+    let parse = async {
+        let mut reader = BufReader::new(stdout);
+        let mut parser = DiffParser::default();
+        // Reuse one line buffer for the whole stream; next_line() would
+        // allocate a fresh String per line, which dominates for large diffs.
+        let mut buf = String::new();
+        loop {
+            buf.clear();
+            let n = reader
+                .read_line(&mut buf)
+                .await
+                .map_err(|e| format!("Failed to read git output: {e}"))?;
+            if n == 0 {
+                break;
+            }
+            let mut line = buf.as_str();
+            if let Some(stripped) = line.strip_suffix('\n') {
+                line = stripped;
+            }
+            if let Some(stripped) = line.strip_suffix('\r') {
+                line = stripped;
+            }
+            parser.push_line(line);
+        }
+        Ok::<_, String>(parser)
+    };
+
+    // Drain stderr concurrently with the stdout parse: if it were only read
+    // after stdout hits EOF, a child filling the stderr pipe buffer while
+    // still producing its diff would deadlock against us.
+    let drain = async {
+        let mut err = Vec::new();
+        let _ = stderr.read_to_end(&mut err).await;
+        err
+    };
+
+    let (parser, err) = tokio::join!(parse, drain);
+    let parser = parser?;
+
+    let status = child
+        .wait()
+        .await
+        .map_err(|e| format!("Failed to run git: {e}"))?;
+
+    if !status.success() {
+        return Err(format!(
+            "Git diff failed: {}",
+            String::from_utf8_lossy(&err)
+        ));
     }
 
-    files
+    Ok(parser.finish())
 }
 
-pub async fn get_git_diff(
-    repo: &str,
-    commit_a: Option<&str>,
-    commit_b: Option<&str>,
-    flags: &GitFlags,
-    paths: Option<&[String]>,
-    cached: bool,
-) -> Result<GitDiff, String> {
-    let mut cmd = Command::new("git");
+/// Base command for the two patch producers (`git diff` and `git show`):
+/// they take the same flags and emit the same format, parsed by the same
+/// DiffParser.
+fn patch_command(repo: &str, subcommand: &str, flags: GitFlags) -> Command {
+    let mut cmd = git_command(repo);
     cmd.args([
-        "diff",
+        subcommand,
         "--patch",
         "--no-color",
         "--find-renames",
         "--find-copies",
         &format!("--unified={}", flags.context_lines),
         &format!("--diff-algorithm={}", flags.diff_algo),
-    ])
-    .current_dir(repo);
+    ]);
+    if flags.ignore_all_space {
+        cmd.arg("--ignore-all-space");
+    }
+    cmd
+}
+
+pub async fn get_git_diff(
+    repo: &str,
+    commit_a: Option<&str>,
+    commit_b: Option<&str>,
+    flags: GitFlags,
+    paths: Option<&[String]>,
+    cached: bool,
+) -> Result<GitDiff, String> {
+    let mut cmd = patch_command(repo, "diff", flags);
 
     if cached {
         cmd.arg("--cached");
     }
 
-    if flags.ignore_all_space {
-        cmd.arg("--ignore-all-space");
-    }
-
     let (effective_a, effective_b) = match (commit_a, commit_b) {
         (Some(a), Some(b)) => (Some(a.to_string()), Some(b.to_string())),
         (Some(a), None) => (Some(format!("{a}^")), Some(a.to_string())),
@@ -612,20 +841,7 @@ pub async fn get_git_diff(
         }
     }
 
-    let output = cmd
-        .output()
-        .await
-        .map_err(|e| format!("Failed to run git diff: {e}"))?;
-
-    if !output.status.success() {
-        return Err(format!(
-            "Git diff failed: {}",
-            String::from_utf8_lossy(&output.stderr)
-        ));
-    }
-
-    let stdout = String::from_utf8_lossy(&output.stdout);
-    let files = parse_diff_output(&stdout);
+    let files = run_diff_command(cmd).await?;
 
     Ok(GitDiff {
         from_commit: effective_a,
@@ -637,25 +853,11 @@ pub async fn get_git_diff(
 pub async fn get_commit_diff(
     repo: &str,
     commit: &str,
-    flags: &GitFlags,
+    flags: GitFlags,
     paths: Option<&[String]>,
 ) -> Result<GitDiff, String> {
-    let mut cmd = Command::new("git");
-    cmd.args([
-        "show",
-        "--patch",
-        "--no-color",
-        "--find-renames",
-        "--find-copies",
-        &format!("--unified={}", flags.context_lines),
-        &format!("--diff-algorithm={}", flags.diff_algo),
-        "--pretty=format:",
-    ])
-    .current_dir(repo);
-
-    if flags.ignore_all_space {
-        cmd.arg("--ignore-all-space");
-    }
+    let mut cmd = patch_command(repo, "show", flags);
+    cmd.arg("--pretty=format:");
 
     cmd.arg(commit);
 
@@ -666,20 +868,7 @@ pub async fn get_commit_diff(
         }
     }
 
-    let output = cmd
-        .output()
-        .await
-        .map_err(|e| format!("Failed to run git show: {e}"))?;
-
-    if !output.status.success() {
-        return Err(format!(
-            "Git show failed: {}",
-            String::from_utf8_lossy(&output.stderr)
-        ));
-    }
-
-    let stdout = String::from_utf8_lossy(&output.stdout);
-    let files = parse_diff_output(&stdout);
+    let files = run_diff_command(cmd).await?;
 
     Ok(GitDiff {
         from_commit: Some(commit.to_string()),
@@ -733,17 +922,25 @@ pub fn parse_compact_summary_line(line: &str) -> Option<FileChange> {
 
     if changes_part.starts_with("Bin") {
         file_change.is_binary = true;
-    } else {
-        let parts: Vec<&str> = changes_part.split_whitespace().collect();
-        if let Some(first) = parts.first() {
-            if let Ok(total) = first.parse::<u32>() {
-                let plus_count = changes_part.chars().filter(|&c| c == '+').count() as u32;
-                let minus_count = changes_part.chars().filter(|&c| c == '-').count() as u32;
-                file_change.additions = Some(plus_count);
-                file_change.deletions = Some(minus_count);
-                file_change.changes = Some(total);
+    } else if let Some(total) = changes_part
+        .split_whitespace()
+        .next()
+        .and_then(|s| s.parse::<u32>().ok())
+    {
+        // The +/- bar only ever contains ASCII, so count both in one pass
+        // over the bytes instead of two char scans.
+        let mut plus_count = 0u32;
+        let mut minus_count = 0u32;
+        for b in changes_part.bytes() {
+            match b {
+                b'+' => plus_count += 1,
+                b'-' => minus_count += 1,
+                _ => {}
             }
         }
+        file_change.additions = Some(plus_count);
+        file_change.deletions = Some(minus_count);
+        file_change.changes = Some(total);
     }
 
     Some(file_change)
@@ -755,9 +952,8 @@ pub async fn git_diff_compact_summary(
     commit_b: Option<&str>,
     cached: bool,
 ) -> Result<GitDiffSummary, String> {
-    let mut cmd = Command::new("git");
-    cmd.args(["diff", "--compact-summary", "--stat=10000000"])
-        .current_dir(repo);
+    let mut cmd = git_command(repo);
+    cmd.args(["diff", "--compact-summary", "--stat=10000000"]);
 
     if cached {
         cmd.arg("--cached");
@@ -852,21 +1048,7 @@ pub fn read_untracked_file(repo: &str, path: &str) -> UntrackedFileContent {
 }
 
 pub async fn get_untracked_files(repo: &str) -> Result<Vec<String>, String> {
-    let output = Command::new("git")
-        .args(["ls-files", "--others", "--exclude-standard"])
-        .current_dir(repo)
-        .output()
-        .await
-        .map_err(|e| format!("Failed to run git ls-files: {e}"))?;
-
-    if !output.status.success() {
-        return Err(format!(
-            "git ls-files failed: {}",
-            String::from_utf8_lossy(&output.stderr)
-        ));
-    }
-
-    let stdout = String::from_utf8_lossy(&output.stdout);
+    let stdout = run_git(repo, &["ls-files", "--others", "--exclude-standard"]).await?;
     Ok(stdout
         .lines()
         .filter(|l| !l.is_empty())
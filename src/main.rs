@@ -16,7 +16,7 @@ use tokio::sync::watch;
 use tracing::info;
 use tracing_subscriber::EnvFilter;
 
-use crate::git::find_git_repos;
+use crate::git::{RepoEntry, find_git_repos};
 use crate::server::{AppState, ws_handler};
 
 #[derive(Embed)]
@@ -138,16 +138,13 @@ async fn main() {
         std::process::exit(1);
     });
 
-    let (repos_tx, repos_rx) = watch::channel(Vec::new());
+    let (repos_tx, _) = watch::channel::<Arc<Vec<RepoEntry>>>(Arc::new(Vec::new()));
     let repos_tx = Arc::new(repos_tx);
-    let (notification_tx, notification_rx) =
-        watch::channel(Some("Discovering repos...".to_string()));
+    let (notification_tx, _) = watch::channel(Some("Discovering repos...".to_string()));
     let notification_tx = Arc::new(notification_tx);
 
     let app_state = Arc::new(AppState {
-        repos_rx,
         repos_tx: repos_tx.clone(),
-        notification_rx,
         notification_tx: notification_tx.clone(),
         root: root.clone(),
     });
@@ -156,8 +153,10 @@ async fn main() {
     tokio::task::spawn_blocking(move || {
         let repos = find_git_repos(&root);
         info!("Found {} git repos under {}", repos.len(), root.display());
-        let _ = repos_tx.send(repos);
-        let _ = notification_tx.send(None);
+        // send_replace: the value must be stored even while no connection
+        // (and hence no receiver) exists yet.
+        repos_tx.send_replace(Arc::new(repos));
+        notification_tx.send_replace(None);
     });
 
     let app = Router::new()
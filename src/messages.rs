@@ -1,3 +1,5 @@
+use std::sync::Arc;
+
 use serde::{Deserialize, Serialize};
 
 use crate::git::{
@@ -7,9 +9,13 @@ use crate::git::{
 
 #[derive(Debug, Clone, Serialize, Deserialize)]
 pub struct SessionState {
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub repo: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub branch: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub commit_a: Option<String>,
+    #[serde(skip_serializing_if = "Option::is_none")]
     pub commit_b: Option<String>,
     pub open_paths: Vec<String>,
     pub git_flags: GitFlags,
@@ -37,9 +43,11 @@ pub enum ServerMsg {
         state: SessionState,
     },
     Repos {
-        repos: Vec<RepoEntry>,
+        // shared snapshot of the discovery result; cloning a message must
+        // not deep-copy the whole repo list
+        repos: Arc<Vec<RepoEntry>>,
         recent: Vec<Worktree>,
-        root: String,
+        root: Arc<str>,
     },
     Branches {
         branches: Vec<GitBranch>,
@@ -50,22 +58,24 @@ pub enum ServerMsg {
     Commits {
         commits: Vec<Commit>,
     },
+    // The diff payloads are boxed so the enum (and hence every queued
+    // message) stays the size of its small variants.
     Diff {
-        diff: GitDiff,
+        diff: Box<GitDiff>,
         partial: bool,
     },
     #[serde(rename = "staged-diff")]
     StagedDiff {
-        diff: GitDiff,
+        diff: Box<GitDiff>,
         partial: bool,
     },
     #[serde(rename = "diff-summary")]
     DiffSummary {
-        summary: GitDiffSummary,
+        summary: Box<GitDiffSummary>,
     },
     #[serde(rename = "staged-summary")]
     StagedSummary {
-        summary: GitDiffSummary,
+        summary: Box<GitDiffSummary>,
     },
     #[serde(rename = "untracked-files")]
     UntrackedFiles {
@@ -74,10 +84,12 @@ pub enum ServerMsg {
     #[serde(rename = "untracked-content")]
     UntrackedContent {
         path: String,
+        #[serde(skip_serializing_if = "Option::is_none")]
         content: Option<String>,
         is_binary: bool,
     },
     Notification {
+        #[serde(skip_serializing_if = "Option::is_none")]
         message: Option<String>,
     },
     Ping,
@@ -1,27 +1,29 @@
+use std::collections::HashMap;
 use std::path::PathBuf;
 use std::sync::Arc;
+use std::sync::atomic::{AtomicU64, Ordering};
 use std::time::Duration;
 
-use axum::extract::ws::{Message, WebSocket};
+use axum::extract::ws::{Message, Utf8Bytes, WebSocket};
 use axum::extract::{State, WebSocketUpgrade};
 use axum::response::Response;
 use futures_util::{SinkExt, StreamExt};
-use notify::{Event, RecommendedWatcher, RecursiveMode, Watcher};
+use notify::{Event, EventKind, RecommendedWatcher, RecursiveMode, Watcher};
 use tokio::sync::{mpsc, watch};
-use tracing::{debug, info, warn};
+use tracing::{debug, info, trace, warn};
 
 use crate::git::{
-    GitFlags, RepoEntry, Worktree, find_git_repos, get_commit_diff, get_current_branch,
-    get_git_diff, get_git_log, get_list_of_branches, get_list_of_tags, get_untracked_files,
-    git_diff_compact_summary, git_fetch, read_untracked_file,
+    GitDiff, GitFlags, RepoEntry, Worktree, find_git_repos, get_commit_diff, get_current_branch,
+    get_git_diff, get_git_log, get_head_branch, get_list_of_branches, get_list_of_tags,
+    get_untracked_files, git_diff_compact_summary, git_fetch, read_untracked_file,
 };
 use crate::messages::{ClientMsg, ServerMsg, SessionState};
 
 #[derive(Clone)]
 pub struct AppState {
-    pub repos_rx: watch::Receiver<Vec<RepoEntry>>,
-    pub repos_tx: Arc<watch::Sender<Vec<RepoEntry>>>,
-    pub notification_rx: watch::Receiver<Option<String>>,
+    // The watch senders are the single source of truth; each connection
+    // subscribes its own receiver on upgrade.
+    pub repos_tx: Arc<watch::Sender<Arc<Vec<RepoEntry>>>>,
     pub notification_tx: Arc<watch::Sender<Option<String>>>,
     pub root: PathBuf,
 }
@@ -30,25 +32,37 @@ pub async fn ws_handler(ws: WebSocketUpgrade, State(state): State<Arc<AppState>>
     ws.on_upgrade(move |socket| handle_socket(socket, state))
 }
 
+/// Monotonic connection id, cheap to mint and unique for the server's
+/// lifetime; used to correlate log lines per connection.
+static NEXT_CONN_ID: AtomicU64 = AtomicU64::new(1);
+
 async fn handle_socket(socket: WebSocket, app_state: Arc<AppState>) {
+    let conn_id = NEXT_CONN_ID.fetch_add(1, Ordering::Relaxed);
+    info!("WebSocket connection {conn_id} opened");
+
     let (mut ws_tx, mut ws_rx) = socket.split();
 
-    let (tx, mut rx) = mpsc::channel::<Vec<ServerMsg>>(10000);
-    let (client_tx, mut client_rx) = mpsc::channel::<ClientMsg>(10000);
+    let (tx, mut rx) = mpsc::unbounded_channel::<Utf8Bytes>();
+    let (client_tx, mut client_rx) = mpsc::unbounded_channel::<ClientMsg>();
     let (file_change_tx, mut file_change_rx) = mpsc::channel::<()>(100);
 
-    // Task: forward serialized messages to the WebSocket
+    // Task: forward pre-serialized frames to the WebSocket. Frames are fed
+    // into the sink's buffer and flushed once the queue is drained, so a
+    // burst of updates costs a single syscall instead of one per frame.
     let send_task = tokio::spawn(async move {
-        while let Some(msgs) = rx.recv().await {
-            let text = match serde_json::to_string(&msgs) {
-                Ok(t) => t,
-                Err(e) => {
-                    warn!("Failed to serialize message: {e}");
-                    continue;
+        'outer: while let Some(mut frame) = rx.recv().await {
+            loop {
+                debug!("Sending WS frame ({} bytes)", frame.len());
+                trace!("Sending WS: {frame}");
+                if ws_tx.feed(Message::Text(frame)).await.is_err() {
+                    break 'outer;
                 }
-            };
-            debug!("Sending WS: {text}");
-            if ws_tx.send(Message::Text(text.into())).await.is_err() {
+                match rx.try_recv() {
+                    Ok(next) => frame = next,
+                    Err(_) => break,
+                }
+            }
+            if ws_tx.flush().await.is_err() {
                 break;
             }
         }
@@ -59,10 +73,11 @@ async fn handle_socket(socket: WebSocket, app_state: Arc<AppState>) {
         while let Some(Ok(msg)) = ws_rx.next().await {
             match msg {
                 Message::Text(text) => {
-                    debug!("Received WS: {text}");
+                    debug!("Received WS frame ({} bytes)", text.len());
+                    trace!("Received WS: {text}");
                     match serde_json::from_str::<ClientMsg>(&text) {
                         Ok(client_msg) => {
-                            if client_tx.send(client_msg).await.is_err() {
+                            if client_tx.send(client_msg).is_err() {
                                 break;
                             }
                         }
@@ -84,73 +99,64 @@ async fn handle_socket(socket: WebSocket, app_state: Arc<AppState>) {
         let mut watcher_handle: Option<tokio::task::JoinHandle<()>> = None;
         let mut watched_repo: Option<String> = None;
         let mut recent_repos: Vec<Worktree> = Vec::new();
-        let mut repos_rx = app_state.repos_rx.clone();
-        let mut notification_rx = app_state.notification_rx.clone();
+        let mut diff_cache = DiffCache::default();
+        let mut repos_rx = app_state.repos_tx.subscribe();
+        let mut notification_rx = app_state.notification_tx.subscribe();
+        // Snapshot the root once; it is immutable for the server's lifetime
+        // and was previously re-stringified for every Repos message.
+        let root: Arc<str> = Arc::from(app_state.root.to_string_lossy().as_ref());
 
         // Send initial data (may be empty if discovery is still in progress)
         {
             let repos = repos_rx.borrow_and_update().clone();
             let notification = notification_rx.borrow_and_update().clone();
-            let _ = tx2
-                .send(vec![
+            send_msgs(
+                &tx2,
+                &[
                     ServerMsg::Repos {
                         repos,
                         recent: recent_repos.clone(),
-                        root: app_state.root.to_string_lossy().to_string(),
+                        root: root.clone(),
                     },
                     ServerMsg::Notification {
                         message: notification,
                     },
-                ])
-                .await;
+                ],
+            );
         }
 
         loop {
             tokio::select! {
                 Ok(()) = repos_rx.changed() => {
                     let repos = repos_rx.borrow_and_update().clone();
-                    let _ = tx2.send(vec![ServerMsg::Repos {
+                    send_msgs(&tx2, &[ServerMsg::Repos {
                         repos,
                         recent: recent_repos.clone(),
-                        root: app_state.root.to_string_lossy().to_string(),
-                    }]).await;
+                        root: root.clone(),
+                    }]);
                 }
                 Ok(()) = notification_rx.changed() => {
                     let message = notification_rx.borrow_and_update().clone();
-                    let _ = tx2.send(vec![ServerMsg::Notification { message }]).await;
+                    send_msgs(&tx2, &[ServerMsg::Notification { message }]);
                 }
                 Some(msg) = client_rx.recv() => {
-                    if matches!(msg, ClientMsg::RefreshRepos) {
-                        let root = app_state.root.clone();
-                        let repos_tx = app_state.repos_tx.clone();
-                        let notif_tx = app_state.notification_tx.clone();
-                        let _ = notif_tx.send(Some("Discovering repos...".to_string()));
-                        tokio::task::spawn_blocking(move || {
-                            let repos = find_git_repos(&root);
-                            let _ = repos_tx.send(repos);
-                            let _ = notif_tx.send(None);
-                        });
-                        continue;
-                    }
-
-                    if let ClientMsg::RepoSelect { ref repo } = msg {
-                        update_recent_repos(&mut recent_repos, repo);
-                    }
-
                     let state_changed = handle_client_msg(
                         msg,
                         &mut session,
+                        &mut recent_repos,
+                        &mut diff_cache,
+                        &app_state,
                         &tx2,
                     ).await;
 
                     if state_changed {
-                        let _ = tx2.send(vec![ServerMsg::SessionState { state: session.clone() }]).await;
+                        send_msgs(&tx2, &[ServerMsg::SessionState { state: session.clone() }]);
 
                         if let Some(ref repo) = session.repo {
-                            send_repo_data(repo, session.branch.as_deref(), &session.git_flags, &tx2).await;
+                            send_repo_data(repo, session.branch.as_deref(), session.git_flags, &tx2).await;
                             send_diff_summary(&session, &tx2).await;
                             if !session.open_paths.is_empty() {
-                                send_diff(Some(&session.open_paths), &session, &tx2).await;
+                                send_diff(Some(&session.open_paths), &session, &mut diff_cache, &tx2).await;
                             }
 
                             // Restart file watcher whenever the repo changes
@@ -174,11 +180,11 @@ async fn handle_socket(socket: WebSocket, app_state: Arc<AppState>) {
                 }
                 Some(()) = file_change_rx.recv() => {
                     if let Some(ref repo) = session.repo {
-                        send_repo_data(repo, session.branch.as_deref(), &session.git_flags, &tx2).await;
+                        send_repo_data(repo, session.branch.as_deref(), session.git_flags, &tx2).await;
                     }
                     send_diff_summary(&session, &tx2).await;
                     if !session.open_paths.is_empty() {
-                        send_diff(Some(&session.open_paths), &session, &tx2).await;
+                        send_diff(Some(&session.open_paths), &session, &mut diff_cache, &tx2).await;
                     }
                 }
                 else => break,
@@ -197,13 +203,57 @@ async fn handle_socket(socket: WebSocket, app_state: Arc<AppState>) {
         _ = handler_task => {},
     }
 
-    info!("WebSocket connection closed");
+    info!("WebSocket connection {conn_id} closed");
+}
+
+/// Session-local cache of diff frames for pinned commits. Diffs between two
+/// fixed commits (or of a single commit) never change, so re-running git for
+/// every open/close of a file is pure waste. Everything that affects the git
+/// output is part of the key, with one caveat: the endpoints may be tag
+/// names rather than hashes, and a fetch can move tags — so the cache is
+/// cleared whenever the session fetches.
+#[derive(Default)]
+struct DiffCache {
+    entries: HashMap<String, Vec<Utf8Bytes>>,
+}
+
+impl DiffCache {
+    const MAX_ENTRIES: usize = 64;
+
+    fn get(&self, key: &str) -> Option<Vec<Utf8Bytes>> {
+        self.entries.get(key).cloned()
+    }
+
+    fn insert(&mut self, key: String, frames: Vec<Utf8Bytes>) {
+        if self.entries.len() >= Self::MAX_ENTRIES {
+            self.entries.clear();
+        }
+        self.entries.insert(key, frames);
+    }
+
+    fn clear(&mut self) {
+        self.entries.clear();
+    }
+}
+
+/// Serialize a batch of messages once, at enqueue time; the socket writer
+/// then only forwards ready-made frames.
+fn send_msgs(tx: &mpsc::UnboundedSender<Utf8Bytes>, msgs: &[ServerMsg]) {
+    match serde_json::to_string(msgs) {
+        Ok(text) => {
+            let _ = tx.send(text.into());
+        }
+        Err(e) => warn!("Failed to serialize message: {e}"),
+    }
 }
 
 async fn handle_client_msg(
     msg: ClientMsg,
     session: &mut SessionState,
-    tx: &mpsc::Sender<Vec<ServerMsg>>,
+    recent_repos: &mut Vec<Worktree>,
+    diff_cache: &mut DiffCache,
+    app_state: &Arc<AppState>,
+    tx: &mpsc::UnboundedSender<Utf8Bytes>,
 ) -> bool {
     match msg {
         ClientMsg::Heartbeat { .. } | ClientMsg::Ping | ClientMsg::Pong => false,
@@ -264,19 +314,23 @@ async fn handle_client_msg(
             true
         }
         ClientMsg::GetDiff { paths } => {
-            send_diff(paths.as_deref(), session, tx).await;
+            send_diff(paths.as_deref(), session, diff_cache, tx).await;
             false
         }
         ClientMsg::GitFetch => {
             if let Some(ref repo) = session.repo {
                 let _ = git_fetch(repo).await;
-                send_repo_data(repo, session.branch.as_deref(), &session.git_flags, tx).await;
+                // A fetch can move tags, which may be what commit_a/commit_b
+                // name; cached frames keyed on them are no longer trustworthy.
+                diff_cache.clear();
+                send_repo_data(repo, session.branch.as_deref(), session.git_flags, tx).await;
                 send_diff_summary(session, tx).await;
                 session.open_paths.clear();
             }
             true
         }
         ClientMsg::RepoSelect { repo } => {
+            update_recent_repos(recent_repos, &repo).await;
             if session.repo.as_deref() != Some(&repo) {
                 session.commit_a = None;
                 session.commit_b = None;
@@ -294,7 +348,7 @@ async fn handle_client_msg(
                     if let Ok(commits) =
                         get_git_log(repo, Some(&branch), session.git_flags.max_count).await
                     {
-                        let _ = tx.send(vec![ServerMsg::Commits { commits }]).await;
+                        send_msgs(tx, &[ServerMsg::Commits { commits }]);
                     }
                 }
             }
@@ -303,7 +357,7 @@ async fn handle_client_msg(
         ClientMsg::OpenPath { path } => {
             if !session.open_paths.contains(&path) {
                 session.open_paths.push(path.clone());
-                send_diff(Some(&[path]), session, tx).await;
+                send_diff(Some(&[path]), session, diff_cache, tx).await;
             }
             true
         }
@@ -326,45 +380,73 @@ async fn handle_client_msg(
         ClientMsg::GetUntrackedContent { path } => {
             if let Some(ref repo) = session.repo {
                 let result = read_untracked_file(repo, &path);
-                let _ = tx
-                    .send(vec![ServerMsg::UntrackedContent {
+                send_msgs(
+                    tx,
+                    &[ServerMsg::UntrackedContent {
                         path,
                         content: result.content,
                         is_binary: result.is_binary,
-                    }])
-                    .await;
+                    }],
+                );
             }
             false
         }
-        ClientMsg::RefreshRepos => false,
+        ClientMsg::RefreshRepos => {
+            let root = app_state.root.clone();
+            let repos_tx = app_state.repos_tx.clone();
+            let notif_tx = app_state.notification_tx.clone();
+            notif_tx.send_replace(Some("Discovering repos...".to_string()));
+            tokio::task::spawn_blocking(move || {
+                let repos = find_git_repos(&root);
+                // Only wake the sessions if the repo list actually changed; a
+                // no-op refresh is common and would otherwise re-broadcast to
+                // every connection.
+                repos_tx.send_if_modified(|current| {
+                    if **current == repos {
+                        false
+                    } else {
+                        *current = Arc::new(repos);
+                        true
+                    }
+                });
+                notif_tx.send_replace(None);
+            });
+            false
+        }
     }
 }
 
 async fn send_repo_data(
     repo: &str,
     branch: Option<&str>,
-    flags: &GitFlags,
-    tx: &mpsc::Sender<Vec<ServerMsg>>,
+    flags: GitFlags,
+    tx: &mpsc::UnboundedSender<Utf8Bytes>,
 ) {
+    let (branches, tags, commits) = tokio::join!(
+        get_list_of_branches(repo),
+        get_list_of_tags(repo),
+        get_git_log(repo, branch, flags.max_count),
+    );
+
     let mut msgs = Vec::new();
 
-    if let Ok(branches) = get_list_of_branches(repo).await {
+    if let Ok(branches) = branches {
         msgs.push(ServerMsg::Branches { branches });
     }
-    if let Ok(tags) = get_list_of_tags(repo).await {
+    if let Ok(tags) = tags {
         let tags: Vec<_> = tags.into_iter().take(100).collect();
         msgs.push(ServerMsg::Tags { tags });
     }
-    if let Ok(commits) = get_git_log(repo, branch, flags.max_count).await {
+    if let Ok(commits) = commits {
         msgs.push(ServerMsg::Commits { commits });
     }
 
     if !msgs.is_empty() {
-        let _ = tx.send(msgs).await;
+        send_msgs(tx, &msgs);
     }
 }
 
-async fn send_diff_summary(session: &SessionState, tx: &mpsc::Sender<Vec<ServerMsg>>) {
+async fn send_diff_summary(session: &SessionState, tx: &mpsc::UnboundedSender<Utf8Bytes>) {
     let Some(ref repo) = session.repo else {
         return;
     };
@@ -378,21 +460,35 @@ async fn send_diff_summary(session: &SessionState, tx: &mpsc::Sender<Vec<ServerM
         )
         .await;
         if let Ok(summary) = result {
-            let _ = tx.send(vec![ServerMsg::DiffSummary { summary }]).await;
+            send_msgs(
+                tx,
+                &[ServerMsg::DiffSummary {
+                    summary: Box::new(summary),
+                }],
+            );
         }
     } else {
+        let (unstaged, staged, untracked) = tokio::join!(
+            git_diff_compact_summary(repo, None, None, false),
+            git_diff_compact_summary(repo, None, None, true),
+            get_untracked_files(repo),
+        );
         let mut msgs = Vec::new();
-        if let Ok(summary) = git_diff_compact_summary(repo, None, None, false).await {
-            msgs.push(ServerMsg::DiffSummary { summary });
+        if let Ok(summary) = unstaged {
+            msgs.push(ServerMsg::DiffSummary {
+                summary: Box::new(summary),
+            });
         }
-        if let Ok(summary) = git_diff_compact_summary(repo, None, None, true).await {
-            msgs.push(ServerMsg::StagedSummary { summary });
+        if let Ok(summary) = staged {
+            msgs.push(ServerMsg::StagedSummary {
+                summary: Box::new(summary),
+            });
         }
-        if let Ok(files) = get_untracked_files(repo).await {
+        if let Ok(files) = untracked {
             msgs.push(ServerMsg::UntrackedFiles { files });
         }
         if !msgs.is_empty() {
-            let _ = tx.send(msgs).await;
+            send_msgs(tx, &msgs);
         }
     }
 }
@@ -400,7 +496,8 @@ async fn send_diff_summary(session: &SessionState, tx: &mpsc::Sender<Vec<ServerM
 async fn send_diff(
     paths: Option<&[String]>,
     session: &SessionState,
-    tx: &mpsc::Sender<Vec<ServerMsg>>,
+    cache: &mut DiffCache,
+    tx: &mpsc::UnboundedSender<Utf8Bytes>,
 ) {
     let Some(ref repo) = session.repo else {
         return;
@@ -410,43 +507,108 @@ async fn send_diff(
 
     match (&session.commit_a, &session.commit_b) {
         (Some(a), Some(b)) => {
+            let key = format!(
+                "{repo}\x01{a}\x01{b}\x01{:?}\x01{paths:?}\x01{partial}",
+                session.git_flags
+            );
+            if let Some(frames) = cache.get(&key) {
+                send_frames(frames, tx);
+                return;
+            }
             if let Ok(diff) =
-                get_git_diff(repo, Some(a), Some(b), &session.git_flags, paths, false).await
+                get_git_diff(repo, Some(a), Some(b), session.git_flags, paths, false).await
             {
-                let _ = tx.send(vec![ServerMsg::Diff { diff, partial }]).await;
+                let frames = diff_frames(diff, partial, false);
+                cache.insert(key, frames.clone());
+                send_frames(frames, tx);
             }
         }
         (Some(a), None) => {
-            if let Ok(diff) = get_commit_diff(repo, a, &session.git_flags, paths).await {
-                let _ = tx.send(vec![ServerMsg::Diff { diff, partial }]).await;
+            let key = format!(
+                "{repo}\x01{a}\x01\x01{:?}\x01{paths:?}\x01{partial}",
+                session.git_flags
+            );
+            if let Some(frames) = cache.get(&key) {
+                send_frames(frames, tx);
+                return;
+            }
+            if let Ok(diff) = get_commit_diff(repo, a, session.git_flags, paths).await {
+                let frames = diff_frames(diff, partial, false);
+                cache.insert(key, frames.clone());
+                send_frames(frames, tx);
             }
         }
         _ => {
-            let mut msgs = Vec::new();
-            if let Ok(diff) = get_git_diff(repo, None, None, &session.git_flags, paths, false).await
-            {
-                msgs.push(ServerMsg::Diff { diff, partial });
+            let (unstaged, staged) = tokio::join!(
+                get_git_diff(repo, None, None, session.git_flags, paths, false),
+                get_git_diff(repo, None, None, session.git_flags, paths, true),
+            );
+            if let Ok(diff) = unstaged {
+                send_frames(diff_frames(diff, partial, false), tx);
             }
-            if let Ok(diff) = get_git_diff(repo, None, None, &session.git_flags, paths, true).await
-            {
-                msgs.push(ServerMsg::StagedDiff { diff, partial });
-            }
-            if !msgs.is_empty() {
-                let _ = tx.send(msgs).await;
+            if let Ok(diff) = staged {
+                send_frames(diff_frames(diff, partial, true), tx);
             }
         }
     }
 }
 
-fn update_recent_repos(recent: &mut Vec<Worktree>, repo: &str) {
+/// Serialize a diff response into outgoing frames. A partial diff covering
+/// several files is split into one frame per file, so the client can parse
+/// and render each file as soon as it arrives instead of waiting for the
+/// whole payload.
+fn diff_frames(diff: GitDiff, partial: bool, staged: bool) -> Vec<Utf8Bytes> {
+    let wrap = |diff: GitDiff| {
+        let diff = Box::new(diff);
+        if staged {
+            ServerMsg::StagedDiff { diff, partial }
+        } else {
+            ServerMsg::Diff { diff, partial }
+        }
+    };
+
+    let msgs: Vec<ServerMsg> = if partial && diff.files.len() > 1 {
+        let GitDiff {
+            from_commit,
+            to_commit,
+            files,
+        } = diff;
+        files
+            .into_iter()
+            .map(|file| {
+                wrap(GitDiff {
+                    from_commit: from_commit.clone(),
+                    to_commit: to_commit.clone(),
+                    files: vec![file],
+                })
+            })
+            .collect()
+    } else {
+        vec![wrap(diff)]
+    };
+
+    msgs.iter()
+        .filter_map(
+            |msg| match serde_json::to_string(std::slice::from_ref(msg)) {
+                Ok(text) => Some(text.into()),
+                Err(e) => {
+                    warn!("Failed to serialize message: {e}");
+                    None
+                }
+            },
+        )
+        .collect()
+}
+
+fn send_frames(frames: Vec<Utf8Bytes>, tx: &mpsc::UnboundedSender<Utf8Bytes>) {
+    for frame in frames {
+        let _ = tx.send(frame);
+    }
+}
+
+async fn update_recent_repos(recent: &mut Vec<Worktree>, repo: &str) {
     recent.retain(|wt| wt.path != repo);
-    let branch = std::process::Command::new("git")
-        .args(["rev-parse", "--abbrev-ref", "HEAD"])
-        .current_dir(repo)
-        .output()
-        .ok()
-        .filter(|o| o.status.success())
-        .map(|o| String::from_utf8_lossy(&o.stdout).trim().to_string());
+    let branch = get_head_branch(repo).await;
     recent.insert(
         0,
         Worktree {
@@ -463,8 +625,14 @@ async fn watch_repo(repo: &str, tx: mpsc::Sender<()>) {
 
     let mut watcher = match RecommendedWatcher::new(
         move |res: Result<Event, notify::Error>| {
-            if let Ok(_event) = res {
-                let _ = notify_tx.blocking_send(());
+            if let Ok(event) = res {
+                // Ignore access-only events (reads, opens, closes without
+                // write): the refresh handler's own git invocations generate
+                // them, and forwarding them would make every refresh
+                // re-trigger the watcher in a permanent feedback loop.
+                if !matches!(event.kind, EventKind::Access(_)) {
+                    let _ = notify_tx.blocking_send(());
+                }
             }
         },
         notify::Config::default(),
@@ -483,12 +651,22 @@ async fn watch_repo(repo: &str, tx: mpsc::Sender<()>) {
 
     info!("Watching repo {repo} for changes");
 
+    // How long the repo must stay quiet before a burst of events is
+    // considered finished.
+    const QUIET_PERIOD: Duration = Duration::from_millis(100);
+
     loop {
         if notify_rx.recv().await.is_none() {
             break;
         }
-        tokio::time::sleep(Duration::from_millis(300)).await;
-        while notify_rx.try_recv().is_ok() {}
+        // Absorb the rest of the burst: keep draining events until none
+        // arrives for QUIET_PERIOD. A single change now triggers a refresh
+        // after ~100ms instead of a fixed 300ms sleep, while a long burst
+        // (e.g. a checkout) still collapses into one notification.
+        while tokio::time::timeout(QUIET_PERIOD, notify_rx.recv())
+            .await
+            .is_ok_and(|event| event.is_some())
+        {}
         let _ = tx.send(()).await;
     }
 }